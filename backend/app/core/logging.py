@@ -4,9 +4,12 @@ AfterIDE - Logging Configuration
 Structured logging setup using structlog for comprehensive application logging.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 # Try to import structlog, fallback to basic logging if not available
 try:
@@ -24,6 +27,13 @@ except ImportError:
     JSONLOGGER_AVAILABLE = False
     print("⚠️  pythonjsonlogger not available, but not needed for basic functionality")
 
+# Try to import orjson for faster JSON log rendering, fallback to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import settings with fallback
 try:
     from app.core.config import settings
@@ -35,15 +45,70 @@ except ImportError:
     settings = FallbackSettings()
 
 
+# Log records are queued by the caller and written to stdout by a background listener
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_log_listener: Optional[QueueListener] = None
+
+
+def _start_log_listener() -> QueueHandler:
+    """
+    Start the background thread that writes queued log records to stdout.
+    
+    Returns:
+        Handler that enqueues records for the listener thread
+    """
+    global _log_listener
+    if _log_listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _log_listener = QueueListener(_log_queue, stream_handler)
+        _log_listener.start()
+    return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing any queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+# Drain the queue once at interpreter exit rather than on any one app shutdown
+atexit.register(shutdown_logging)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, decoded to str for the stdlib logging handlers."""
+    # Stringify non-str dict keys the way the stdlib json module does
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+def _json_renderer():
+    """Build the JSON renderer, backed by orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer()
+
+
 def setup_logging() -> None:
     """Configure structured logging for the application."""
     
     if STRUCTLOG_AVAILABLE:
-        # Configure standard library logging
+        log_level = getattr(logging, settings.LOG_LEVEL.upper())
+        
+        # Configure standard library logging; records are written to stdout
+        # by a listener thread so callers only pay for enqueueing them.
+        # basicConfig leaves a root logger that already has handlers alone, so
+        # only run the listener when the queue handler is or will be installed
+        root_logger = logging.getLogger()
+        if not root_logger.handlers or _queue_handler in root_logger.handlers:
+            _start_log_listener()
         logging.basicConfig(
             format="%(message)s",
-            stream=sys.stdout,
-            level=getattr(logging, settings.LOG_LEVEL.upper()),
+            handlers=[_queue_handler],
+            level=log_level,
         )
         
         # Configure structlog
@@ -59,12 +124,13 @@ def setup_logging() -> None:
                 structlog.processors.format_exc_info,
                 
                 # JSON formatting for production, console for development
-                structlog.processors.JSONRenderer() if settings.LOG_FORMAT == "json" 
+                _json_renderer() if settings.LOG_FORMAT == "json" 
                 else structlog.dev.ConsoleRenderer(),
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            # Calls below the configured level return immediately, before any processor runs
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
             cache_logger_on_first_use=True,
         )
     else:
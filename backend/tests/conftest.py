@@ -5,8 +5,10 @@ This file provides common fixtures used across all backend tests.
 """
 
 import pytest
-import asyncio
-from unittest.mock import AsyncMock
+import pytest_asyncio
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 import uuid
@@ -18,12 +20,117 @@ from app.models.file import File
 from app.models.submission import Submission, SubmissionStatus
 
 
+_CONFIG_JSON = '{"language": "python"}'
+_EXPIRES_AT = datetime(2023, 12, 31, 23, 59, 59)
+_CREATED_AT = datetime(2023, 12, 31, 0, 0, 0)
+
+# Attribute values for a Session row stand-in, shared by the endpoint unit tests
+_SESSION_DEFAULTS = MappingProxyType({
+    "id": "test-session-id",
+    "user_id": "test-user-id",
+    "name": "Test Session",
+    "description": "Test Description",
+    "status": "active",
+    "config": _CONFIG_JSON,
+    "expires_at": _EXPIRES_AT,
+    "max_memory_mb": 512,
+    "max_cpu_cores": 1,
+    "max_execution_time": 30,
+    "created_at": _CREATED_AT,
+    "updated_at": _CREATED_AT,
+    "last_activity": _CREATED_AT,
+})
+
+_workspace_service_patch = patch('app.api.v1.workspace.WorkspaceService')
+
+
+class FastAsyncStub:
+    """Awaitable stand-in for AsyncMock that records calls without any spec scanning."""
+
+    __slots__ = ("return_value", "calls")
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+    @property
+    def await_count(self):
+        return len(self.calls)
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt():
+    """Hash passwords at bcrypt's minimum cost; tests only need hash/verify round-trips."""
+    from passlib.context import CryptContext
+    from app.services import auth
+    with patch.object(auth, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto")):
+        yield
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the assembled application once per test session."""
+    from app.main import app as _app
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a session-wide test client for the application, without entering its lifespan."""
+    from fastapi.testclient import TestClient
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(app):
+    """Create a session-wide async client that calls the application over ASGI, without entering its lifespan."""
+    from httpx import AsyncClient, ASGITransport
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def api_app():
+    """Build a bare FastAPI app with only the v1 API router mounted, once per session."""
+    from fastapi import FastAPI
+    from app.api.v1.api import api_router
+    _app = FastAPI()
+    _app.include_router(api_router, prefix="/api/v1")
+    return _app
+
+
+@pytest.fixture(scope="session")
+def api_client(api_app):
+    """Create a session-wide test client for the bare v1 API app, without entering its lifespan."""
+    from fastapi.testclient import TestClient
+    return TestClient(api_app, raise_server_exceptions=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def route_index(app):
+    """Build the set of (method, path) pairs mounted on the application."""
+    return {
+        (method, route.path)
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ()
+    }
+
+
+@pytest.fixture(scope="session")
+def route_paths(app):
+    """Collect the paths mounted on the application into a set, once per session."""
+    return frozenset(route.path for route in app.routes)
 
 
 @pytest.fixture(scope="session")
@@ -165,6 +272,78 @@ async def test_submission(db_session: AsyncSession, test_user: User, test_file:
     return submission
 
 
+@pytest.fixture(scope="session")
+def make_session_mock():
+    """Return a factory that builds a session stand-in from the defaults plus overrides."""
+    def _make_session_mock(**overrides):
+        return SimpleNamespace(**{**_SESSION_DEFAULTS, **overrides})
+    return _make_session_mock
+
+
+@pytest.fixture(scope="module")
+def canonical_session():
+    """One unmodified session stand-in shared by every test in a module."""
+    return SimpleNamespace(**_SESSION_DEFAULTS)
+
+
+@pytest.fixture(scope="session")
+def submission_prototype():
+    """Build one pending submission stand-in, with its user, reviewer and file, for the whole run."""
+    now = datetime.now()
+    return SimpleNamespace(
+        id=str(uuid.uuid4()),
+        title="Test Submission",
+        description="Test description",
+        file_id=str(uuid.uuid4()),
+        user_id=str(uuid.uuid4()),
+        reviewer_id=str(uuid.uuid4()),
+        status=SubmissionStatus.PENDING,
+        review_comments=None,
+        review_metadata={},
+        created_at=now,
+        updated_at=now,
+        submitted_at=now,
+        reviewed_at=None,
+        user=SimpleNamespace(id=str(uuid.uuid4()), username="testuser", role=UserRole.USER),
+        reviewer=SimpleNamespace(id=str(uuid.uuid4()), username="reviewer", role=UserRole.USER),
+        file=SimpleNamespace(
+            id=str(uuid.uuid4()), filename="test.py", filepath="/test.py", language="python",
+            content="print('hello world')",
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def patched_workspace_service():
+    """Patch the workspace API's WorkspaceService once per module with stubbed async methods."""
+    service = SimpleNamespace(
+        create_user_workspace=FastAsyncStub(),
+        get_user_workspace=FastAsyncStub(),
+        get_workspace_files=FastAsyncStub(),
+        save_file=FastAsyncStub(),
+        delete_file=FastAsyncStub(),
+        get_file_content=FastAsyncStub(),
+    )
+    mock_service_class = _workspace_service_patch.start()
+    mock_service_class.return_value = service
+    yield service
+    _workspace_service_patch.stop()
+
+
+@pytest.fixture
+def workspace_service(patched_workspace_service):
+    """Hand each test the patched workspace service with fresh method stubs."""
+    for name in vars(patched_workspace_service):
+        setattr(patched_workspace_service, name, FastAsyncStub())
+    return patched_workspace_service
+
+
+@pytest.fixture(scope="session")
+def fast_async_stub():
+    """Expose FastAsyncStub as a factory: fast_async_stub(return_value) builds one stub."""
+    return FastAsyncStub
+
+
 @pytest.fixture
 def mock_db():
     """Create a mock database session for unit tests."""
@@ -5,13 +5,12 @@ Tests the basic structure of endpoints that are not yet implemented.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch
+from fastapi import APIRouter
 
 from app.api.v1.endpoints.executions import router as executions_router
 from app.api.v1.endpoints.files import router as files_router
 from app.api.v1.endpoints.submissions import router as submissions_router
-from app.main import app
+from app.api.v1.endpoints.auth import get_current_user_dependency
 
 
 class TestExecutionsEndpoint:
@@ -19,8 +18,7 @@ class TestExecutionsEndpoint:
     
     def test_executions_router_exists(self):
         """Test that the executions router exists."""
-        assert executions_router is not None
-        assert hasattr(executions_router, 'routes')
+        assert isinstance(executions_router, APIRouter)
     
     def test_executions_router_routes_empty(self):
         """Test that the executions router has no routes yet."""
@@ -32,8 +30,7 @@ class TestFilesEndpoint:
     
     def test_files_router_exists(self):
         """Test that the files router exists."""
-        assert files_router is not None
-        assert hasattr(files_router, 'routes')
+        assert isinstance(files_router, APIRouter)
     
     def test_files_router_routes_empty(self):
         """Test that the files router has no routes yet."""
@@ -45,38 +42,31 @@ class TestSubmissionsEndpoint:
     
     def test_submissions_router_exists(self):
         """Test that the submissions router exists."""
-        assert submissions_router is not None
-        assert hasattr(submissions_router, 'routes')
+        assert isinstance(submissions_router, APIRouter)
     
     def test_submissions_router_routes_empty(self):
         """Test that the submissions router has no routes yet."""
         assert len(submissions_router.routes) == 0
 
 
+@pytest.mark.xdist_group(name="app_client")
 class TestAPIEndpointsIntegration:
     """Test API endpoints integration with main app."""
     
-    def test_api_v1_endpoints_included(self):
-        """Test that API v1 endpoints are included in the main app."""
-        client = TestClient(app)
+    def test_api_v1_endpoints_mounted(self, app, route_index):
+        """Test that the API v1 auth and sessions endpoints are mounted in the main app."""
+        # No root endpoint, but the router is mounted under the prefix
+        assert not any(path == "/api/v1/" for _, path in route_index)
+        assert ("POST", "/api/v1/auth/login") in route_index
+        assert ("GET", "/api/v1/sessions/") in route_index
+        assert app.url_path_for("login") == "/api/v1/auth/login"
+        assert app.url_path_for("list_sessions") == "/api/v1/sessions/"
         
-        # Test that the API base path exists
-        # This will return 404 but confirms the router is mounted
-        response = client.get("/api/v1/")
-        assert response.status_code == 404  # No root endpoint, but router is mounted
-    
-    def test_api_v1_auth_endpoints_accessible(self):
-        """Test that auth endpoints are accessible."""
-        client = TestClient(app)
-        
-        # Test login endpoint exists (will return validation error, not 404)
-        response = client.post("/api/v1/auth/login", json={})
-        assert response.status_code == 422  # Validation error, not 404
-    
-    def test_api_v1_sessions_endpoints_accessible(self):
-        """Test that API v1 sessions endpoints are accessible."""
-        client = TestClient(app)
+        # Login validates a request body (422 rather than 404 on empty JSON)
+        login_route = next(r for r in app.routes if getattr(r, "name", None) == "login")
+        assert login_route.body_field is not None
         
-        # Test sessions endpoint exists (will return 403 due to auth, not 404)
-        response = client.get("/api/v1/sessions/")
-        assert response.status_code == 403  # Forbidden, not 404 
\ No newline at end of file
+        # Listing sessions requires authentication (403 rather than 404)
+        sessions_route = next(r for r in app.routes if getattr(r, "name", None) == "list_sessions")
+        dependencies = [d.call for d in sessions_route.dependant.dependencies]
+        assert get_current_user_dependency in dependencies
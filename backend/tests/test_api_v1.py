@@ -5,12 +5,26 @@ Tests the main API router configuration and endpoint inclusion.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
 from app.api.v1.api import api_router
 
 
+_ROUTE_PREFIXES = ("/auth", "/sessions", "/files", "/workspace")
+
+
+@pytest.fixture(scope="module")
+def router_paths():
+    """Walk api_router.routes once and bucket the route paths by expected prefix."""
+    index = {prefix: [] for prefix in _ROUTE_PREFIXES}
+    for route in api_router.routes:
+        path = getattr(route, "path", "")
+        for prefix in _ROUTE_PREFIXES:
+            if prefix in path:
+                index[prefix].append(path)
+    return index
+
+
 class TestAPIV1Router:
     """Test the API v1 router configuration."""
     
@@ -23,85 +37,40 @@ class TestAPIV1Router:
         """Test that the API router has routes."""
         assert len(api_router.routes) > 0
     
-    def test_api_router_includes_auth_endpoints(self):
+    def test_api_router_includes_auth_endpoints(self, router_paths):
         """Test that auth endpoints are included."""
-        auth_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and '/auth' in route.path
-        ]
-        assert len(auth_routes) > 0
+        assert len(router_paths["/auth"]) > 0
     
-    def test_api_router_includes_sessions_endpoints(self):
+    def test_api_router_includes_sessions_endpoints(self, router_paths):
         """Test that sessions endpoints are included."""
-        sessions_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and '/sessions' in route.path
-        ]
-        assert len(sessions_routes) > 0
+        assert len(router_paths["/sessions"]) > 0
     
-    def test_api_router_includes_files_endpoints(self):
+    def test_api_router_includes_files_endpoints(self, router_paths):
         """Test that files endpoints are included."""
-        files_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and '/files' in route.path
-        ]
-        assert len(files_routes) > 0
-    
-    def test_api_router_includes_executions_endpoints(self):
-        """Test that API router includes executions endpoints."""
-        executions_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and 'executions' in route.path
-        ]
-        # Executions endpoints are placeholders and may not have routes yet
-        # This test verifies the router structure exists
-        assert hasattr(api_router, 'routes')
+        assert len(router_paths["/files"]) > 0
     
     def test_api_router_includes_submissions_endpoints(self):
-        """Test that API router includes submissions endpoints."""
-        submissions_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and 'submissions' in route.path
-        ]
-        # Submissions endpoints are placeholders and may not have routes yet
-        # This test verifies the router structure exists
-        assert hasattr(api_router, 'routes')
+        """Test that submissions endpoints are included."""
+        routes = {(method, route.path) for route in api_router.routes for method in getattr(route, "methods", None) or ()}
+        assert ("POST", "/submissions/") in routes
+        assert ("GET", "/submissions/{submission_id}") in routes
     
-    def test_api_router_includes_workspace_endpoints(self):
+    def test_api_router_includes_workspace_endpoints(self, router_paths):
         """Test that workspace endpoints are included."""
-        workspace_routes = [
-            route for route in api_router.routes 
-            if hasattr(route, 'path') and '/workspace' in route.path
-        ]
-        assert len(workspace_routes) > 0
+        assert len(router_paths["/workspace"]) > 0
     
     def test_api_router_route_tags(self):
         """Test that routes have appropriate tags."""
-        # Check that routes have tags
-        for route in api_router.routes:
-            if hasattr(route, 'tags'):
-                assert route.tags is not None
-                assert len(route.tags) > 0
+        untagged = [route.path for route in api_router.routes if hasattr(route, 'tags') and not route.tags]
+        assert untagged == []
+        expected_tags = {"authentication", "sessions", "files", "workspace"}
+        actual_tags = {tag for route in api_router.routes for tag in getattr(route, 'tags', None) or ()}
+        assert expected_tags <= actual_tags
     
-    def test_api_router_route_prefixes(self):
+    def test_api_router_route_prefixes(self, router_paths):
         """Test that routes have appropriate prefixes."""
-        expected_prefixes = [
-            "/auth",
-            "/sessions", 
-            "/files",
-            "/executions",
-            "/submissions",
-            "/workspace"
-        ]
-        
-        route_prefixes = []
-        for route in api_router.routes:
-            if hasattr(route, 'path'):
-                route_prefixes.append(route.path)
-        
         # Check that at least some expected prefixes are present
-        found_prefixes = [prefix for prefix in expected_prefixes 
-                         if any(prefix in route_path for route_path in route_prefixes)]
+        found_prefixes = [prefix for prefix, paths in router_paths.items() if paths]
         assert len(found_prefixes) > 0
     
     def test_api_router_structure(self):
@@ -121,44 +90,22 @@ class TestAPIV1Router:
 class TestAPIV1Integration:
     """Test API v1 integration with FastAPI."""
     
-    def test_api_router_can_be_included(self):
+    def test_api_router_can_be_included(self, api_app):
         """Test that the API router can be included in a FastAPI app."""
-        from fastapi import FastAPI
-        
-        app = FastAPI()
-        app.include_router(api_router, prefix="/api/v1")
-        
         # Verify the router was included
-        assert len(app.routes) > 0
+        assert len(api_app.routes) > 0
         
         # Check that routes from the API router are present
-        api_routes = [route for route in app.routes 
+        api_routes = [route for route in api_app.routes 
                      if hasattr(route, 'path') and '/api/v1' in route.path]
         assert len(api_routes) > 0
     
-    def test_api_router_with_test_client(self):
-        """Test API router with FastAPI test client."""
-        from fastapi import FastAPI
-        
-        app = FastAPI()
-        app.include_router(api_router, prefix="/api/v1")
-        
-        client = TestClient(app)
-        
-        # Test that the API base path exists
-        # This will return 404 but confirms the router is mounted
-        response = client.get("/api/v1/")
-        assert response.status_code == 404  # No root endpoint, but router is mounted
-    
-    def test_api_router_endpoint_accessibility(self):
-        """Test that API router endpoints are accessible."""
-        from fastapi import FastAPI
-        
-        app = FastAPI()
-        app.include_router(api_router, prefix="/api/v1")
-        
-        client = TestClient(app)
-        
-        # Test that sessions endpoint exists (will return 403 due to auth, not 404)
-        response = client.get("/api/v1/sessions/")
-        assert response.status_code == 403  # Forbidden, not 404 
\ No newline at end of file
+    @pytest.mark.parametrize("path,status", [
+        # No root endpoint, but a 404 confirms the router is mounted
+        pytest.param("/api/v1/", 404, id="root"),
+        # Sessions endpoint exists: forbidden without auth, not 404
+        pytest.param("/api/v1/sessions/", 403, id="sessions"),
+    ])
+    def test_api_router_endpoints(self, api_client, path, status):
+        """Test API router endpoints through the FastAPI test client."""
+        assert api_client.get(path).status_code == status
\ No newline at end of file
@@ -12,18 +12,52 @@ from app.services.auth import AuthService
 from app.schemas.auth import UserLogin, TokenResponse
 
 
+_EXPECTED_AUTH_METHODS = (
+    "verify_password",
+    "get_password_hash",
+    "create_access_token",
+    "verify_token",
+    "authenticate_user",
+    "login_user",
+    "get_current_user",
+)
+
+
+@pytest.fixture(scope="module")
+def known_hash():
+    """Hash "testpassword" once per module; bcrypt is deliberately slow."""
+    return AuthService.get_password_hash("testpassword")
+
+
+@pytest.fixture(scope="module")
+def signed_token():
+    """Sign one access token per module for the tests that only read it back."""
+    data = {"sub": "user123", "username": "testuser"}
+    return data, AuthService.create_access_token(data)
+
+
+@pytest.fixture(scope="module")
+def good_creds():
+    """Valid admin login credentials, validated once per module."""
+    return UserLogin(username="admin", password="password")
+
+
+@pytest.fixture(scope="module")
+def bad_creds():
+    """Admin login credentials with the wrong password, validated once per module."""
+    return UserLogin(username="admin", password="wrongpassword")
+
+
 class TestAuthService:
     """Test cases for AuthService."""
 
-    def test_verify_password(self):
+    def test_verify_password(self, known_hash):
         """Test password verification."""
         # Test with correct password
-        password = "testpassword"
-        hashed = AuthService.get_password_hash(password)
-        assert AuthService.verify_password(password, hashed) is True
+        assert AuthService.verify_password("testpassword", known_hash) is True
         
         # Test with incorrect password
-        assert AuthService.verify_password("wrongpassword", hashed) is False
+        assert AuthService.verify_password("wrongpassword", known_hash) is False
 
     def test_get_password_hash(self):
         """Test password hashing."""
@@ -37,10 +71,9 @@ class TestAuthService:
         # Hash should be verifiable
         assert AuthService.verify_password(password, hashed) is True
 
-    def test_create_access_token(self):
+    def test_create_access_token(self, signed_token):
         """Test access token creation."""
-        data = {"sub": "user123", "username": "testuser"}
-        token = AuthService.create_access_token(data)
+        data, token = signed_token
         
         # Token should be a string
         assert isinstance(token, str)
@@ -61,10 +94,9 @@ class TestAuthService:
         assert payload is not None
         assert payload["sub"] == "user123"
 
-    def test_verify_token_valid(self):
+    def test_verify_token_valid(self, signed_token):
         """Test token verification with valid token."""
-        data = {"sub": "user123", "username": "testuser"}
-        token = AuthService.create_access_token(data)
+        data, token = signed_token
         
         payload = AuthService.verify_token(token)
         assert payload is not None
@@ -76,7 +108,7 @@ class TestAuthService:
         payload = AuthService.verify_token("invalid.token.here")
         assert payload is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_authenticate_user_success(self):
         """Test successful user authentication."""
         user = await AuthService.authenticate_user("admin", "password")
@@ -86,44 +118,28 @@ class TestAuthService:
         assert user["email"] == "admin@afteride.com"
         assert user["role"] == "admin"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_authenticate_user_invalid_credentials(self):
         """Test failed user authentication."""
         user = await AuthService.authenticate_user("admin", "wrongpassword")
         assert user is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_authenticate_user_wrong_password(self):
         """Test authentication with wrong password."""
         user = await AuthService.authenticate_user("admin", "wrongpassword")
         assert user is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_authenticate_user_inactive(self):
         """Test authentication with non-existent user."""
         user = await AuthService.authenticate_user("nonexistent", "password")
         assert user is None
 
-    @pytest.mark.asyncio
-    async def test_create_user_success(self):
-        """Test user creation (placeholder - not implemented in service)."""
-        # This is a placeholder test since create_user is not implemented
-        # in the current AuthService
-        assert True
-
-    @pytest.mark.asyncio
-    async def test_create_user_already_exists(self):
-        """Test user creation with existing user (placeholder)."""
-        # This is a placeholder test since create_user is not implemented
-        # in the current AuthService
-        assert True
-
-    @pytest.mark.asyncio
-    async def test_get_current_user_success(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_current_user_success(self, signed_token):
         """Test getting current user from valid token."""
-        # Create a valid token
-        data = {"sub": "user123", "username": "testuser"}
-        token = AuthService.create_access_token(data)
+        data, token = signed_token
         
         user = await AuthService.get_current_user(token)
         
@@ -131,13 +147,13 @@ class TestAuthService:
         assert user["id"] == "user123"
         assert user["username"] == "testuser"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_current_user_invalid_token(self):
         """Test getting current user with invalid token."""
         user = await AuthService.get_current_user("invalid.token.here")
         assert user is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_current_user_user_not_found(self):
         """Test getting current user with token missing user ID."""
         # Create token without 'sub' field
@@ -147,17 +163,9 @@ class TestAuthService:
         user = await AuthService.get_current_user(token)
         assert user is None
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_inactive(self):
-        """Test getting current user (placeholder for inactive user check)."""
-        # This is a placeholder test since user status checking is not implemented
-        # in the current AuthService
-        assert True
-
-    def test_decode_token_success(self):
+    def test_decode_token_success(self, signed_token):
         """Test token decoding (same as verify_token)."""
-        data = {"sub": "user123", "username": "testuser"}
-        token = AuthService.create_access_token(data)
+        data, token = signed_token
         
         payload = AuthService.verify_token(token)
         assert payload is not None
@@ -169,12 +177,10 @@ class TestAuthService:
         payload = AuthService.verify_token("invalid.token.here")
         assert payload is None
 
-    @pytest.mark.asyncio
-    async def test_login_user_success(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_login_user_success(self, good_creds):
         """Test successful user login."""
-        user_credentials = UserLogin(username="admin", password="password")
-        
-        result = await AuthService.login_user(user_credentials)
+        result = await AuthService.login_user(good_creds)
         
         assert result is not None
         assert isinstance(result, TokenResponse)
@@ -182,26 +188,14 @@ class TestAuthService:
         assert result.token_type == "bearer"
         assert result.expires_in > 0
 
-    @pytest.mark.asyncio
-    async def test_login_user_invalid_credentials(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_login_user_invalid_credentials(self, bad_creds):
         """Test failed user login."""
-        user_credentials = UserLogin(username="admin", password="wrongpassword")
-        
-        result = await AuthService.login_user(user_credentials)
+        result = await AuthService.login_user(bad_creds)
         
         assert result is None
 
-    def test_auth_service_methods_exist(self):
-        """Test that all expected AuthService methods exist."""
-        expected_methods = [
-            'verify_password',
-            'get_password_hash',
-            'create_access_token',
-            'verify_token',
-            'authenticate_user',
-            'login_user',
-            'get_current_user'
-        ]
-        
-        for method in expected_methods:
-            assert hasattr(AuthService, method) 
\ No newline at end of file
+    @pytest.mark.parametrize("name", _EXPECTED_AUTH_METHODS)
+    def test_auth_method_exists(self, name):
+        """Test that each expected AuthService method exists."""
+        assert hasattr(AuthService, name)
\ No newline at end of file
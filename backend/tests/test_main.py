@@ -5,7 +5,6 @@ Tests the application creation, middleware, and health check endpoint.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, MagicMock
 import structlog
 from fastapi import FastAPI
@@ -24,10 +23,10 @@ class TestMainApplication:
         # The description doesn't contain "version" in lowercase
         assert "AfterIDE" in app.description
 
-    def test_health_check_endpoint(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_health_check_endpoint(self, aclient):
         """Test that the health check endpoint works."""
-        client = TestClient(app)
-        response = client.get("/health")
+        response = await aclient.get("/health")
         assert response.status_code == 200
         # The actual response includes more fields
         data = response.json()
@@ -59,21 +58,19 @@ class TestMainApplication:
         assert hasattr(app, 'user_middleware')
         assert len(app.user_middleware) > 0
 
-    def test_api_routes_included(self):
+    def test_api_routes_included(self, route_paths):
         """Test that API routes are included."""
         # Test that the API router is included
         assert hasattr(app, 'router')
         # Check that some API routes exist
-        routes = [route.path for route in app.routes]
-        assert any('/api/' in route for route in routes)
+        assert any('/api/' in route for route in route_paths)
 
-    def test_websocket_routes_included(self):
+    def test_websocket_routes_included(self, route_paths):
         """Test that WebSocket routes are included."""
         # Test that WebSocket routes are included
         assert hasattr(app, 'router')
         # Check that some WebSocket routes exist
-        routes = [route.path for route in app.routes]
-        assert any('/ws/' in route for route in routes)
+        assert any('/ws/' in route for route in route_paths)
 
 
 class TestApplicationInstance:
@@ -85,8 +82,7 @@ class TestApplicationInstance:
         assert hasattr(app, 'title')
         assert app.title == "AfterIDE"
     
-    def test_app_has_health_endpoint(self):
+    def test_app_has_health_endpoint(self, client):
         """Test that the app has the health endpoint."""
-        client = TestClient(app)
         response = client.get("/health")
         assert response.status_code == 200 
\ No newline at end of file
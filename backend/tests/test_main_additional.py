@@ -5,11 +5,19 @@ Tests additional functionality and edge cases.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, MagicMock
+import importlib.util
+import os
 import structlog
+import sys
 
 from app.main import app
+from app.api import v1
+from app.api.v1 import api, endpoints
+from app.core import config, database, logging as core_logging
+from app.core.config import settings
+from app.core.database import engine
+from app.websocket import router as websocket_router
 
 
 class TestMainApplicationAdditional:
@@ -38,36 +46,30 @@ class TestMainApplicationAdditional:
         assert hasattr(app, 'user_middleware')
         assert len(app.user_middleware) > 0
     
-    def test_app_has_api_routes(self):
+    def test_app_has_api_routes(self, route_paths):
         """Test that API routes are included."""
         # Check if API routes are in the app
-        route_paths = [route.path for route in app.routes]
         assert any("/api/" in path for path in route_paths)
     
-    def test_app_has_websocket_routes(self):
+    def test_app_has_websocket_routes(self, route_paths):
         """Test that WebSocket routes are included."""
         # Check if WebSocket routes are in the app
-        route_paths = [route.path for route in app.routes]
         assert any("/ws/" in path for path in route_paths)
     
-    def test_app_has_health_endpoint(self):
+    def test_app_has_health_endpoint(self, route_paths):
         """Test that health endpoint exists."""
-        route_paths = [route.path for route in app.routes]
         assert "/health" in route_paths
     
-    def test_app_has_openapi_endpoint(self):
+    def test_app_has_openapi_endpoint(self, route_paths):
         """Test that OpenAPI endpoint exists."""
-        route_paths = [route.path for route in app.routes]
         assert "/openapi.json" in route_paths
     
-    def test_app_has_docs_endpoint(self):
+    def test_app_has_docs_endpoint(self, route_paths):
         """Test that docs endpoint exists."""
-        route_paths = [route.path for route in app.routes]
         assert "/docs" in route_paths
     
-    def test_app_has_redoc_endpoint(self):
+    def test_app_has_redoc_endpoint(self, route_paths):
         """Test that ReDoc endpoint exists."""
-        route_paths = [route.path for route in app.routes]
         assert "/redoc" in route_paths
     
     def test_app_route_count(self):
@@ -88,42 +90,29 @@ class TestMainApplicationAdditional:
     def test_app_has_database_configured(self):
         """Test that database is configured."""
         # Check if database engine exists
-        from app.core.database import engine
         assert engine is not None
     
     def test_app_has_services_configured(self):
         """Test that services are configured."""
-        # Check if services are imported and available
-        from app.services import auth, session, terminal, user, websocket, workspace
-        assert auth is not None
-        assert session is not None
-        assert terminal is not None
-        assert user is not None
-        assert websocket is not None
-        assert workspace is not None
+        # Check if services are available, without executing the modules
+        for name in ("auth", "session", "terminal", "user", "websocket", "workspace"):
+            assert importlib.util.find_spec(f"app.services.{name}") is not None
     
     def test_app_has_models_configured(self):
         """Test that models are configured."""
-        # Check if models are imported and available
-        from app.models import execution, file, session, submission, user
-        assert execution is not None
-        assert file is not None
-        assert session is not None
-        assert submission is not None
-        assert user is not None
+        # Check if models are available, without executing the modules
+        for name in ("execution", "file", "session", "submission", "user"):
+            assert importlib.util.find_spec(f"app.models.{name}") is not None
     
     def test_app_has_schemas_configured(self):
         """Test that schemas are configured."""
-        # Check if schemas are imported and available
-        from app.schemas import auth, websocket, workspace
-        assert auth is not None
-        assert websocket is not None
-        assert workspace is not None
+        # Check if schemas are available, without executing the modules
+        for name in ("auth", "websocket", "workspace"):
+            assert importlib.util.find_spec(f"app.schemas.{name}") is not None
     
     def test_app_has_config_configured(self):
         """Test that configuration is set up."""
         # Check if settings are imported and available
-        from app.core.config import settings
         assert settings is not None
         assert hasattr(settings, 'DATABASE_URL')
         assert hasattr(settings, 'SECRET_KEY')
@@ -131,16 +120,13 @@ class TestMainApplicationAdditional:
     def test_app_has_core_modules_configured(self):
         """Test that core modules are configured."""
         # Check if core modules are imported and available
-        from app.core import config, database, logging
         assert config is not None
         assert database is not None
-        assert logging is not None
+        assert core_logging is not None
     
     def test_app_has_api_modules_configured(self):
         """Test that API modules are configured."""
         # Check if API modules are imported and available
-        from app.api import v1
-        from app.api.v1 import api, endpoints
         assert v1 is not None
         assert api is not None
         assert endpoints is not None
@@ -148,24 +134,18 @@ class TestMainApplicationAdditional:
     def test_app_has_websocket_modules_configured(self):
         """Test that WebSocket modules are configured."""
         # Check if WebSocket modules are imported and available
-        from app.websocket import router
-        assert router is not None
+        assert websocket_router is not None
     
-    def test_app_route_structure(self):
+    def test_app_route_structure(self, route_paths):
         """Test that the app has a proper route structure."""
-        # Check for specific route patterns
-        route_paths = [route.path for route in app.routes]
-        
         # Should have health endpoint
         assert "/health" in route_paths
         
         # Should have API routes
-        api_routes = [path for path in route_paths if path.startswith("/api/")]
-        assert len(api_routes) > 0
+        assert any(path.startswith("/api/") for path in route_paths)
         
         # Should have WebSocket routes
-        ws_routes = [path for path in route_paths if path.startswith("/ws/")]
-        assert len(ws_routes) > 0
+        assert any(path.startswith("/ws/") for path in route_paths)
     
     def test_app_middleware_structure(self):
         """Test that the app has proper middleware structure."""
@@ -211,22 +191,24 @@ class TestMainApplicationAdditional:
     def test_app_environment_variables(self):
         """Test that the app can access environment variables."""
         # Check if environment variables are accessible
-        import os
         assert 'PYTHONPATH' in os.environ or 'PATH' in os.environ
     
     def test_app_imports(self):
         """Test that all necessary modules can be imported."""
-        # Test that all main modules can be imported without errors
-        try:
-            from app.main import app
-            from app.core.config import settings
-            from app.core.database import engine
-            from app.services import auth, session, terminal, user, websocket, workspace
-            from app.models import execution, file, session as session_model, submission, user as user_model
-            from app.schemas import auth as auth_schema, websocket as ws_schema, workspace as ws_schema
-            assert True  # If we get here, all imports succeeded
-        except ImportError as e:
-            pytest.fail(f"Import failed: {e}")
+        # Importing app.main loads the application's module graph; check it is
+        # already in sys.modules instead of importing each module again
+        required = {
+            "app.main", "app.core.config", "app.core.database",
+            "app.services.auth", "app.services.session", "app.services.terminal",
+            "app.services.websocket", "app.services.workspace",
+            "app.models.execution", "app.models.file", "app.models.session",
+            "app.models.submission", "app.models.user",
+            "app.schemas.auth", "app.schemas.websocket", "app.schemas.workspace",
+        }
+        missing = required - sys.modules.keys()
+        assert not missing, f"not imported: {missing}"
+        # app.main never imports the user service, so only check that it can be found
+        assert importlib.util.find_spec("app.services.user") is not None
     
     def test_app_initialization(self):
         """Test that the app initializes correctly."""
@@ -238,53 +220,16 @@ class TestMainApplicationAdditional:
         assert hasattr(app, 'routes')
         assert hasattr(app, 'user_middleware')
     
-    def test_app_route_methods(self):
-        """Test that routes have proper HTTP methods."""
-        # Check that routes have HTTP methods configured
+    def test_app_route_metadata_invariants(self):
+        """Test route methods and OpenAPI metadata in a single pass over the routes."""
         for route in app.routes:
+            # Routes with HTTP methods should include at least one common method
             if hasattr(route, 'methods'):
                 assert len(route.methods) > 0
-                # Check for common HTTP methods
                 assert any(method in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH'] for method in route.methods)
-    
-    def test_app_route_responses(self):
-        """Test that routes have response models configured."""
-        # Check that routes have response models (for API routes)
-        api_routes = [route for route in app.routes if hasattr(route, 'path') and route.path.startswith('/api/')]
-        
-        for route in api_routes:
-            if hasattr(route, 'response_model'):
-                # Some routes should have response models
-                pass  # Just checking that the attribute exists
-    
-    def test_app_route_dependencies(self):
-        """Test that routes have dependencies configured."""
-        # Check that routes have dependencies (for protected routes)
-        for route in app.routes:
-            if hasattr(route, 'dependencies'):
-                # Some routes should have dependencies
-                pass  # Just checking that the attribute exists
-    
-    def test_app_route_tags(self):
-        """Test that routes have tags configured."""
-        # Check that routes have tags for OpenAPI documentation
-        for route in app.routes:
+            
+            # Tags and dependencies, where a route has them, are lists
             if hasattr(route, 'tags'):
-                # Some routes should have tags
-                pass  # Just checking that the attribute exists
-    
-    def test_app_route_summaries(self):
-        """Test that routes have summaries configured."""
-        # Check that routes have summaries for OpenAPI documentation
-        for route in app.routes:
-            if hasattr(route, 'summary'):
-                # Some routes should have summaries
-                pass  # Just checking that the attribute exists
-    
-    def test_app_route_descriptions(self):
-        """Test that routes have descriptions configured."""
-        # Check that routes have descriptions for OpenAPI documentation
-        for route in app.routes:
-            if hasattr(route, 'description'):
-                # Some routes should have descriptions
-                pass  # Just checking that the attribute exists 
\ No newline at end of file
+                assert isinstance(route.tags, list)
+            if hasattr(route, 'dependencies'):
+                assert isinstance(route.dependencies, list)
\ No newline at end of file
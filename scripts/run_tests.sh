@@ -51,7 +51,7 @@ if [ "$1" = "--install-deps" ]; then
 fi
 
 # Run backend tests
-run_test_suite "Backend Tests" "cd ../backend && python -m pytest tests/ -v --tb=short"
+run_test_suite "Backend Tests" "cd ../backend && python -m pytest tests/ -v --tb=short -n auto --dist loadgroup"
 
 # Run frontend tests (if npm is available)
 if command -v npm &> /dev/null; then